@@ -3,12 +3,22 @@
 import datetime
 import requests
 
+from requests.adapters import HTTPAdapter
 from typing import Optional
 
+try:
+    import orjson as json
+except ImportError:  # pragma: no cover
+    import json
+
 from .exceptions import RequestError, ResponseError
 
 API_URL = "https://stat.ripe.net/data"
 
+# shared session so connections to the API are kept alive and reused
+session = requests.Session()
+session.mount("https://", HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
 
 class Output:
     """Object used to hold the response and metadata from the API."""
@@ -30,6 +40,7 @@ class Output:
         status: Optional[str] = "",
         status_code: Optional[int] = 0,
         time: Optional[str] = "",
+        etag: Optional[str] = "",
     ):
         """Initialize the Output object."""
         self._url = _url
@@ -49,20 +60,31 @@ class Output:
             self.status = str(status)
             self.status_code = int(status_code)
             self.time = datetime.datetime.fromisoformat(time)
+            self.etag = str(etag)
         else:
             raise ResponseError("Invalid response from API")
 
 
-def get(path, params=None):
-    """Retrieve the requested path with parameters as GET from the API."""
+def get(path, params=None, headers=None):
+    """
+    Retrieve the requested path with parameters as GET from the API.
+
+    Returns **None** if the API answers ``304 Not Modified`` to a conditional
+    request made with ``headers`` such as ``If-None-Match``.
+    """
     params = {} if params is None else params
     params = "&".join("{}={}".format(k, v) for k, v in params.items())
 
     url = f"{API_URL}{str(path)}/data.json?{str(params)}"
 
     try:
-        response = requests.get(url)
+        response = session.get(url, headers=headers)
         response.raise_for_status()
-        return Output(url, **response.json())
+
+        if response.status_code == 304:
+            return None
+
+        etag = response.headers.get("ETag", "")
+        return Output(url, etag=etag, **json.loads(response.content))
     except Exception as e:
         raise RequestError(e)
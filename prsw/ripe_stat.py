@@ -72,8 +72,13 @@ class RIPEstat:
         else:
             raise ValueError("data_overload_limit expected 'ignore' or blank string")
 
-    def _get(self, path, params=None):
-        """Retrieve the requested path with parameters as GET from the API."""
+    def _get(self, path, params=None, **kwargs):
+        """
+        Retrieve the requested path with parameters as GET from the API.
+
+        Additional keyword arguments, such as ``headers``, are passed on to
+        :func:`.api.get`.
+        """
         params = {} if params is None else params
 
         if self.data_overload_limit:
@@ -81,7 +86,7 @@ class RIPEstat:
         if self.sourceapp:
             params["sourceapp"] = self.sourceapp
 
-        return get(path, params)
+        return get(path, params, **kwargs)
 
     @property
     def abuse_contact_finder(self) -> Type[AbuseContactFinder]:
@@ -1,14 +1,307 @@
 """Provides the Routing Status endpoint."""
 
 import ipaddress
+import re
+import threading
+import time
 
-from collections import namedtuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import NamedTuple
+from typing import Any, NamedTuple, Optional, Union
 
+from prsw.trie import MultibitTrie
 from prsw.validators import Validators
 
 
+class _slot_cached_property:
+    """
+    Compute a property once and store the value in the ``_cached_<name>`` slot.
+
+    ``functools.cached_property`` needs an instance ``__dict__``, which classes
+    using ``__slots__`` do not have.
+    """
+
+    def __init__(self, func):
+        """Wrap ``func``, keeping its docstring for the property."""
+        self.func = func
+        self.__doc__ = func.__doc__
+
+    def __set_name__(self, owner, name):
+        """Derive the slot name from the attribute name."""
+        self.slot = f"_cached_{name}"
+
+    def __get__(self, instance, owner=None):
+        """Return the cached value, computing and storing it on first access."""
+        if instance is None:
+            return self
+
+        try:
+            return getattr(instance, self.slot)
+        except AttributeError:
+            value = self.func(instance)
+            setattr(instance, self.slot, value)
+            return value
+
+
+class V4totals(NamedTuple):
+    """Announced IPv4 space: number of IPs and prefixes."""
+
+    ips: int
+    prefixes: int
+
+
+class V6totals(NamedTuple):
+    """Announced IPv6 space: number of /48s and prefixes."""
+
+    amount_of_48s: int
+    prefixes: int
+
+
+class Versions(NamedTuple):
+    """Announced space totals per IP version."""
+
+    v4: V4totals
+    v6: V6totals
+
+
+class FirstSeen(NamedTuple):
+    """The first observed announcement of the resource."""
+
+    time: datetime
+    origin: int
+    prefix: Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+class LastSeen(NamedTuple):
+    """The last observed announcement of the resource."""
+
+    time: datetime
+    origin: int
+    prefix: Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+class MoreSpecific(NamedTuple):
+    """A more specific prefix and its origin ASN."""
+
+    prefix: Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+    origin: int
+
+
+class LessSpecific(NamedTuple):
+    """A less specific prefix and its origin ASN."""
+
+    prefix: Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+    origin: int
+
+
+class PrefixColumns(NamedTuple):
+    """Parallel numpy columns of network addresses, prefix lengths and origins."""
+
+    net: Any
+    plen: Any
+    origin: Any
+
+
+class RIStable(NamedTuple):
+    """RIS full-feed peers seeing the resource, out of all RIS peers."""
+
+    ris_peers_seeing: int
+    total_ris_peers: int
+
+
+class Visibility(NamedTuple):
+    """RIS visibility per IP version."""
+
+    v4: RIStable
+    v6: RIStable
+
+
+# numpy dtype of a more specific IPv4 row, see RoutingStatus.more_specifics_array()
+MORE_SPECIFIC_V4_DTYPE = [("net", "u4"), ("plen", "u1"), ("origin", "u4")]
+
+# multibit trie strides per IP version, see RoutingStatus.lpm()
+TRIE_STRIDES = {4: (16, 4, 4, 4, 4), 6: (16,) + (4,) * 28}
+
+# pre-classification of resource strings, see RoutingStatus._resource()
+_ASN_RE = re.compile(r"\A(?:AS)?(\d{1,10})\Z", re.IGNORECASE)
+_PREFIX_RE = re.compile(r"\A[\da-f:.]+/\d{1,3}\Z", re.IGNORECASE)
+
+
+def _numpy():
+    """Import numpy on first use, it is an optional dependency."""
+    try:
+        import numpy
+    except ImportError:  # pragma: no cover
+        raise ImportError("array output requires numpy") from None
+
+    return numpy
+
+
+def _network(prefix):
+    """Parse a prefix straight into IPv4Network or IPv6Network."""
+    if ":" in prefix:
+        return ipaddress.IPv6Network(prefix, strict=False)
+
+    return ipaddress.IPv4Network(prefix, strict=False)
+
+
+class _Origins(dict):
+    """Map raw origin values to a single shared **int** per ASN."""
+
+    def __missing__(self, origin):
+        asn = self[origin] = int(origin)
+        return asn
+
+
+def _specifics(rows, row_type):
+    """
+    Parse raw ``prefix``/``origin`` rows into ``row_type`` named tuples.
+
+    Rows are parsed here on first access rather than by a json ``object_hook``,
+    a hook is still handed a fully built dict per row and rules out orjson.
+    """
+    network = _network
+
+    # share one int object per origin ASN across all rows
+    origins = _Origins()
+
+    return [row_type(network(row["prefix"]), origins[row["origin"]]) for row in rows]
+
+
+def _get(RIPEstat, path, params, cached=None):
+    """
+    Request the API.
+
+    If ``cached`` is a previous response with an ETag, the request is sent as a
+    conditional request. A ``304 Not Modified`` answer returns ``cached``
+    without transferring or parsing the response again.
+    """
+    if cached is None or not cached.etag:
+        return RIPEstat._get(path, params)
+
+    output = RIPEstat._get(path, params, headers={"If-None-Match": cached.etag})
+
+    # not modified since the cached response
+    return cached if output is None else output
+
+
+def _columns(rows):
+    """
+    Split raw ``prefix``/``origin`` rows into IPv4 and IPv6 numpy columns.
+
+    Returns a pair of *PrefixColumns*, IPv4 first. IPv4 networks are a ``u4``
+    column, IPv6 networks an ``(n, 2)`` ``u8`` column of high and low 64 bits.
+    """
+    np = _numpy()
+
+    v4_rows = []
+    v6_rows = []
+
+    for row in rows:
+        (v6_rows if ":" in row["prefix"] else v4_rows).append(row)
+
+    v4 = PrefixColumns(
+        np.empty(len(v4_rows), dtype="u4"),
+        np.empty(len(v4_rows), dtype="u1"),
+        np.empty(len(v4_rows), dtype="u4"),
+    )
+    v6 = PrefixColumns(
+        np.empty((len(v6_rows), 2), dtype="u8"),
+        np.empty(len(v6_rows), dtype="u1"),
+        np.empty(len(v6_rows), dtype="u4"),
+    )
+
+    for i, row in enumerate(v4_rows):
+        address, plen = row["prefix"].split("/")
+        plen = int(plen)
+
+        v4.net[i] = int(ipaddress.IPv4Address(address)) & ~(0xFFFFFFFF >> plen)
+        v4.plen[i] = plen
+        v4.origin[i] = int(row["origin"])
+
+    for i, row in enumerate(v6_rows):
+        address, plen = row["prefix"].split("/")
+        plen = int(plen)
+        address = int(ipaddress.IPv6Address(address)) & ~((2 ** 128 - 1) >> plen)
+
+        v6.net[i] = (address >> 64, address & 0xFFFFFFFFFFFFFFFF)
+        v6.plen[i] = plen
+        v6.origin[i] = int(row["origin"])
+
+    return v4, v6
+
+
+class _ResponseCache:
+    """
+    Least recently used cache of API responses.
+
+    Entries are keyed by the request, never by the RIPEstat instance, so no
+    client is kept alive by the cache. Expired responses are kept until evicted
+    so their ETag can be used to revalidate them.
+    """
+
+    def __init__(self, maxsize):
+        """Initialize an empty cache holding up to ``maxsize`` responses."""
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        """Get the number of cached responses."""
+        return len(self._entries)
+
+    def clear(self):
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def get(self, key, ttl):
+        """
+        Return the response for ``key``, or None if missing or expired.
+
+        A response expires once ``time // ttl`` changes after it was stored, that
+        is at the end of the ``ttl`` seconds wall-clock interval it was stored in,
+        not ``ttl`` seconds after it was stored.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            stored, output = entry
+
+            if stored // ttl != time.time() // ttl:
+                return None
+
+            self._entries.move_to_end(key)
+            return output
+
+    def get_stale(self, key):
+        """Return the response for ``key`` regardless of its age, or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def set(self, key, output):
+        """Store ``output`` for ``key``, evicting the least recently used entry."""
+        with self._lock:
+            self._entries[key] = (time.time(), output)
+            self._entries.move_to_end(key)
+
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+
+_responses = _ResponseCache(maxsize=1024)
+
+
 class RoutingStatus:
     """
     This data call returns a summary of the current BGP routing state of a given IP prefix 
@@ -45,13 +338,41 @@ class RoutingStatus:
             # )
 
             print(roa.origin, roa.prefix, roa.validity, roa.source)
+
+    Responses are cached in memory, shared by all RIPEstat instances with the same
+    ``sourceapp`` and ``data_overload_limit``. By default an entry is reused until
+    the next RIS collection time, see ``CACHE_TTL``. Expired responses are
+    revalidated with their ETag and reused if the API answers ``304 Not Modified``.
+    Pass ``ttl=0`` to request fresh data without storing it, a response already
+    cached is still revalidated. Set ``RoutingStatus.CACHE_TTL = 0`` to disable
+    caching altogether and call ``RoutingStatus.clear_cache()`` to drop all cached
+    responses.
     """
 
+    __slots__ = (
+        "_api",
+        "_resource_type",
+        "_cached_announced_space",
+        "_cached_first_seen",
+        "_cached_last_seen",
+        "_cached_less_specifics",
+        "_cached_more_specifics",
+        "_cached__more_specifics_columns",
+        "_cached_observed_neighbours",
+        "_cached_query_time",
+        "_cached_resource",
+        "_cached_visibility",
+        "_cached__tries",
+    )
+
     PATH = "/routing-status"
     VERSION = "3.0"
-    resource_type = ""
 
-    def __init__(self, RIPEstat, resource):
+    # seconds responses are cached, the default expires them on the RIS collection
+    # times (00:00, 08:00 and 16:00 UTC)
+    CACHE_TTL = 8 * 60 * 60
+
+    def __init__(self, RIPEstat, resource, ttl: Optional[int] = None):
         """
         Initialize and request RoutingStatus.
 
@@ -61,6 +382,11 @@ class RoutingStatus:
         sam dont forget to write that IP addresses with no prefix will default to /32
         :param prefix: The prefix to perform the RPKI validity state lookup. Note the
             prefix’s length is also taken from this field.
+        :param ttl: Length in seconds of the wall-clock intervals, counted from the
+            epoch, within which a response is reused for identical queries (defaults
+            to ``RoutingStatus.CACHE_TTL``). A response expires at the end of the
+            interval it was stored in, so it may be reused for less than ``ttl``
+            seconds. Set to ``0`` to always request fresh data and not cache it.
 
         """
         params = {
@@ -68,150 +394,331 @@ class RoutingStatus:
             "resource": str(self._resource(resource)),
         }
 
-        self._api = RIPEstat._get(RoutingStatus.PATH, params)
+        ttl = RoutingStatus.CACHE_TTL if ttl is None else ttl
+        key = (
+            RoutingStatus.PATH,
+            tuple(sorted(params.items())),
+            RIPEstat.sourceapp,
+            RIPEstat.data_overload_limit,
+        )
+
+        self._api = _responses.get(key, ttl) if ttl else None
+
+        if self._api is None:
+            cached = _responses.get_stale(key)
+            self._api = _get(RIPEstat, RoutingStatus.PATH, params, cached)
+
+            if ttl:
+                _responses.set(key, self._api)
+
+    @classmethod
+    def clear_cache(cls):
+        """Drop all cached RoutingStatus responses."""
+        _responses.clear()
+
+    @classmethod
+    def bulk(
+        cls, RIPEstat, resources, max_workers: int = 16, ttl: Optional[int] = None
+    ):
+        """
+        Request RoutingStatus for many resources concurrently.
+
+        Returns a **list** of RoutingStatus in the same order as ``resources``.
+
+        :param resources: An iterable of ASNs and/or IP prefixes.
+        :param max_workers: Maximum number of requests in flight at once.
+        :param ttl: Length in seconds of the wall-clock intervals responses are
+            reused within, a response expires at the end of the interval it was
+            stored in. See ``__init__``.
+
+        .. code-block:: python
+
+            import prsw
+            from prsw.stat.routing_status import RoutingStatus
+
+            ripe = prsw.RIPEstat()
+
+            for status in RoutingStatus.bulk(ripe, [3333, 196, 1299]):
+                print(status.resource, status.visibility)
+
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(lambda resource: cls(RIPEstat, resource, ttl), resources)
+            )
 
     def _resource(self, value):
         """Validate and return a valid resource value."""
-        resource = None
 
-        # check if resource is a valid ASN
-        if Validators._validate_asn(str(value)):
-            resource = int(value)
-            RoutingStatus.resource_type = "asn"
+        # fast path for ASNs passed as int
+        if type(value) is int and Validators._validate_asn(value):
+            self._resource_type = "asn"
+            return value
+
+        value_str = str(value).strip()
+        asn = _ASN_RE.match(value_str)
+
+        # check if resource is a valid ASN, optionally prefixed with "AS"
+        if asn:
+            if Validators._validate_asn(asn.group(1)):
+                self._resource_type = "asn"
+                return int(asn.group(1))
         # check if resource is an IP network
-        elif Validators._validate_ip_network(value):
-            resource = ipaddress.ip_network(value)
-            RoutingStatus.resource_type = "prefix"
-        else:
-            raise ValueError("Resource must either be valid ASN int or valid IP prefix")
+        elif _PREFIX_RE.match(value_str) or Validators._validate_ip_network(value_str):
+            self._resource_type = "prefix"
+            return ipaddress.ip_network(value_str)
 
-        return resource
+        raise ValueError("Resource must either be valid ASN int or valid IP prefix")
 
-    @property
+    @_slot_cached_property
     def announced_space(self):
         """
-        NEED TO UPDATE THIS SAM
-        This contains information that are related to special purpose Internet number
-        resources, e.g. private address space.
+        The announced address space of the queried ASN.
+
+        Returns a *Versions* named tuple with ``v4`` (``ips``, ``prefixes``) and
+        ``v6`` (``amount_of_48s``, ``prefixes``) totals.
 
         .. code-block:: python
 
-            contacts = ripe.abuse_contact_finder('192.0.0.0')
+            status = ripe.routing_status(3333)
 
-            contacts.global_network_info
-            # GlobalNetworkInfo(description="", name="RIPE NCC PI Allocation")
+            status.announced_space.v4
+            # V4totals(ips=65536, prefixes=9)
 
-            contacts.global_network_info.name
-            # "RIPE NCC PI Allocation"
+        """
+
+        if self._resource_type == "asn":
+            v4 = self._api.data["announced_space"]["v4"]
+            v6 = self._api.data["announced_space"]["v6"]
+
+            return Versions(
+                V4totals(v4["ips"], v4["prefixes"]),
+                V6totals(v6["48s"], v6["prefixes"]),
+            )
+
+    @_slot_cached_property
+    def first_seen(self):
+        """The **datetime**, origin and prefix of the first observed announcement."""
+        first_seen = self._api.data["first_seen"]
+
+        return FirstSeen(
+            time=datetime.fromisoformat(first_seen["time"]),
+            origin=int(first_seen["origin"]),
+            prefix=_network(first_seen["prefix"]),
+        )
+
+    @_slot_cached_property
+    def last_seen(self):
+        """The **datetime**, origin and prefix of the last observed announcement."""
+        last_seen = self._api.data["last_seen"]
+
+        return LastSeen(
+            time=datetime.fromisoformat(last_seen["time"]),
+            origin=int(last_seen["origin"]),
+            prefix=_network(last_seen["prefix"]),
+        )
+
+    @_slot_cached_property
+    def less_specifics(self):
+        """**List** of *LessSpecific* prefixes and origins for a prefix query."""
+        if self._resource_type != "prefix":
+            return []
+
+        return _specifics(self._api.data["less_specifics"], LessSpecific)
 
+    @_slot_cached_property
+    def more_specifics(self):
+        """**List** of *MoreSpecific* prefixes and origins for a prefix query."""
+        if self._resource_type != "prefix":
+            return []
+
+        return _specifics(self._api.data["more_specifics"], MoreSpecific)
+
+    @_slot_cached_property
+    def _tries(self):
+        """Multibit tries over the queried, less and more specifics per IP version."""
+        tries = {}
+        specifics = self.less_specifics + self.more_specifics
+
+        # the queried prefix itself, as last announced
+        if self._resource_type == "prefix" and "last_seen" in self._api.data:
+            if self.last_seen.prefix == _network(self._api.data["resource"]):
+                specifics.insert(len(self.less_specifics), self.last_seen)
+
+        for specific in specifics:
+            prefix = specific.prefix
+
+            if prefix.version not in tries:
+                strides = TRIE_STRIDES[prefix.version]
+                tries[prefix.version] = MultibitTrie(sum(strides), strides)
+
+            tries[prefix.version].insert(
+                int(prefix.network_address), prefix.prefixlen, specific
+            )
+
+        return tries
+
+    def lpm(self, ip):
         """
+        Find the longest prefix of the response covering an IP address.
 
-        if RoutingStatus.resource_type == "asn":
+        Returns the matching *LessSpecific* or *MoreSpecific* named tuple, the
+        *LastSeen* announcement if the queried prefix itself is the longest match,
+        or **None** if no prefix covers the address. The lookup trie is built on
+        first use.
 
-            Versions = namedtuple("Versions", ["v4", "v6"])
-            
-            class V4totals(NamedTuple):
-                ips: int
-                prefixes: int
+        :param ip: An IPv4 or IPv6 address.
 
-            class V6totals(NamedTuple):
-                amount_of_48s: int
-                prefixes: int
+        .. code-block:: python
 
-            v4 = V4totals(**self._api.data["announced_space"]["v4"])
+            status = ripe.routing_status("193.0.0.0/21")
 
-            v6_tuple = {"amount_of_48s": self._api.data["announced_space"]["v6"]["48s"],
-                        "prefixes": self._api.data["announced_space"]["v6"]["prefixes"]}
-            v6 = V6totals(**v6_tuple)
+            status.lpm("193.0.6.1")
+            # MoreSpecific(prefix=IPv4Network('193.0.6.0/24'), origin=12654)
 
-            return Versions(v4, v6)
+            status.lpm("193.0.7.1").prefix
+            # IPv4Network('193.0.0.0/21')
 
-    @property
-    def first_seen(self):
-        # todo handle types 
-        First_seen = namedtuple("First_seen", ["time", "origin", "prefix"])
-        
-        return First_seen(**self._api.data["first_seen"])
+        """
+        address = ipaddress.ip_address(ip)
+        trie = self._tries.get(address.version)
 
-    @property
-    def last_seen(self):
-        # todo handle types 
-        Last_seen = namedtuple("Last_seen", ["time", "origin", "prefix"])
-        
-        return Last_seen(**self._api.data["last_seen"])
+        return trie.lookup(int(address)) if trie else None
 
-    @property
-    def less_specifics(self):
-        if RoutingStatus.resource_type == "prefix":
-            prefixes = []
+    def lpm_batch(self, ips):
+        """
+        Find the origin ASN of the longest matching prefix for many IPv4 addresses.
+
+        Returns a numpy **int64** array with the origin ASN of the `lpm` match for
+        each address, or ``-1`` where no prefix of the response covers it.
+        Requires `numpy <https://numpy.org>`_, the lookup is compiled with
+        `numba <https://numba.pydata.org>`_ on first use when it is installed.
+
+        :param ips: An array-like of IPv4 addresses as integers, e.g. ``u4``.
+
+        .. code-block:: python
+
+            import numpy as np
+            from ipaddress import IPv4Address
+
+            status = ripe.routing_status("193.0.0.0/21")
+            ips = np.array([int(IPv4Address("193.0.6.1"))], dtype="u4")
+
+            status.lpm_batch(ips)
+            # array([12654])
+
+        """
+        np = _numpy()
+        trie = self._tries.get(4)
+
+        if trie is None:
+            return np.full(len(ips), -1, dtype=np.int64)
+
+        matches = trie.lookup_batch(ips)
+        origins = np.fromiter((value.origin for value in trie.values), np.int64)
+
+        return np.where(matches >= 0, origins[matches], -1)
+
+    @_slot_cached_property
+    def _more_specifics_columns(self):
+        """IPv4 and IPv6 *PrefixColumns* parsed straight from the raw rows."""
+        if self._resource_type != "prefix":
+            return _columns([])
+
+        return _columns(self._api.data["more_specifics"])
+
+    def more_specifics_array(self):
+        """
+        The IPv4 ``more_specifics`` as a numpy structured array.
+
+        Each row holds the network address as an integer (``net``), the prefix
+        length (``plen``) and the origin ASN (``origin``), the same data as
+        ``more_specifics_v4``. Requires `numpy <https://numpy.org>`_.
+
+        .. code-block:: python
 
-            class Less_specifics(NamedTuple):
-                prefix: str ## for now, maybe you can check type for any vx address?
-                origin: int
-            
-            for less_specific in self._api.data["less_specifics"]:
-                print(less_specific)
+            status = ripe.routing_status("193.0.0.0/21")
+            rows = status.more_specifics_array()
 
-            
-            return "return"
+            rows["plen"].max()
+            # 24
+
+        """
+        np = _numpy()
+        net, plen, origin = self.more_specifics_v4
+        rows = np.empty(len(net), dtype=MORE_SPECIFIC_V4_DTYPE)
+
+        rows["net"] = net
+        rows["plen"] = plen
+        rows["origin"] = origin
+
+        return rows
 
     @property
-    def more_specifics(self):
-        if RoutingStatus.resource_type == "prefix":
-            more_specifics = []
-            #ccase fix
-            MoreSpecific = namedtuple("MoreSpecific", ["prefix", "origin"])
-           
-            for specific in self._api.data["more_specifics"]:
-                prefix = ipaddress.ip_network(specific["prefix"], strict=False)
-                origin = int(specific["origin"])
-                
-                tuple_data = {"prefix": prefix, "origin":origin}
-                more_specifics.append(MoreSpecific(**tuple_data))
-            
-        return more_specifics
-    
+    def more_specifics_v4(self):
+        """
+        The IPv4 ``more_specifics`` as *PrefixColumns* of numpy arrays.
+
+        ``net`` holds the network addresses as ``u4`` integers, ``plen`` the prefix
+        lengths and ``origin`` the origin ASNs. Requires `numpy <https://numpy.org>`_.
+
+        .. code-block:: python
+
+            status = ripe.routing_status("193.0.0.0/21")
+
+            status.more_specifics_v4.plen.max()
+            # 24
+
+        """
+        return self._more_specifics_columns[0]
+
     @property
+    def more_specifics_v6(self):
+        """
+        The IPv6 ``more_specifics`` as *PrefixColumns* of numpy arrays.
+
+        ``net`` holds each network address as a pair of ``u8`` integers (high and
+        low 64 bits), ``plen`` and ``origin`` are as in ``more_specifics_v4``.
+        Requires `numpy <https://numpy.org>`_.
+        """
+        return self._more_specifics_columns[1]
+
+    @_slot_cached_property
     def observed_neighbours(self):
         """Amount of unique ASes to be BGP neighbours at this point in time."""
         return int(self._api.data["observed_neighbours"])
 
-    @property
+    @_slot_cached_property
     def query_time(self):
         """The **datetime** of the query."""
         return datetime.fromisoformat(self._api.data["query_time"])
 
-    @property
+    @_slot_cached_property
     def resource(self):
         """The resource, autonomous system number, used for the query."""
         return int(self._api.data["resource"])
 
-    @property
+    @_slot_cached_property
     def visibility(self):
         """
-        NEED TO UPDATE THIS SAM
-        This contains information that are related to special purpose Internet number
-        resources, e.g. private address space.
+        How many RIS full-feed peers see the queried resource.
 
-        .. code-block:: python
+        Returns a *Visibility* named tuple with ``v4`` and ``v6`` *RIStable*
+        entries (``ris_peers_seeing``, ``total_ris_peers``).
 
-            contacts = ripe.abuse_contact_finder('192.0.0.0')
+        .. code-block:: python
 
-            contacts.global_network_info
-            # GlobalNetworkInfo(description="", name="RIPE NCC PI Allocation")
+            status = ripe.routing_status(3333)
 
-            contacts.global_network_info.name
-            # "RIPE NCC PI Allocation"
+            status.visibility.v4
+            # RIStable(ris_peers_seeing=328, total_ris_peers=328)
 
         """
 
-        Visibility = namedtuple("Visibility", ["v4", "v6"])
-
-        class RIStable(NamedTuple):
-            ris_peers_seeing: int
-            total_ris_peers: int
-        
-        v4 = RIStable(**self._api.data["visibility"]["v4"])
-        v6 = RIStable(**self._api.data["visibility"]["v6"])
+        v4 = self._api.data["visibility"]["v4"]
+        v6 = self._api.data["visibility"]["v6"]
 
-        return Visibility(v4, v6)
\ No newline at end of file
+        return Visibility(
+            RIStable(v4["ris_peers_seeing"], v4["total_ris_peers"]),
+            RIStable(v6["ris_peers_seeing"], v6["total_ris_peers"]),
+        )
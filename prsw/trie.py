@@ -0,0 +1,193 @@
+"""Provides a multibit trie for longest prefix match lookups."""
+
+import functools
+
+
+def _lookup_batch(match, child, strides, width, keys, out):
+    """Store the ``match`` index for each of ``keys`` in ``out``."""
+    for i in range(keys.shape[0]):
+        key = keys[i]
+        node = 0
+        depth = 0
+        best = -1
+
+        for stride in strides:
+            shift = width - depth - stride
+            slot = node + ((key >> shift) & ((1 << stride) - 1))
+
+            if match[slot] >= 0:
+                best = match[slot]
+
+            node = child[slot]
+
+            if node == 0:
+                break
+
+            depth += stride
+
+        out[i] = best
+
+
+@functools.lru_cache(maxsize=None)
+def _lookup_batch_kernel():
+    """
+    Return ``_lookup_batch``, compiled with numba when it is installed.
+
+    numba is imported and the kernel compiled on first use only, so importing
+    prsw stays cheap for callers that never do batched lookups.
+    """
+    try:
+        from numba import njit
+    except ImportError:  # pragma: no cover
+        return _lookup_batch
+
+    return njit(_lookup_batch)
+
+
+class MultibitTrie:
+    """
+    Multibit trie mapping prefixes to values for longest prefix match lookups.
+
+    Nodes are stored in two flat lists, ``match`` and ``child``. A node with
+    stride ``s`` occupies ``2 ** s`` consecutive slots starting at its offset,
+    the root node is at offset 0. For every slot, ``match`` holds the index into
+    ``values`` of the longest prefix covering it (``-1`` if none) and ``child``
+    holds the offset of the next level node (``0`` if none). Prefixes whose
+    length falls inside a node are expanded over all slots they cover.
+
+    .. code-block:: python
+
+        trie = MultibitTrie(32, (16, 4, 4, 4, 4))
+        trie.insert(int(IPv4Address("193.0.0.0")), 21, "193.0.0.0/21")
+
+        trie.lookup(int(IPv4Address("193.0.1.1")))
+        # "193.0.0.0/21"
+
+    """
+
+    def __init__(self, width, strides):
+        """
+        Initialize an empty trie.
+
+        :param width: Key width in bits, 32 for IPv4 and 128 for IPv6.
+        :param strides: Number of bits consumed at each level, must add up to
+            ``width``.
+        """
+        if sum(strides) != width:
+            raise ValueError("strides must add up to width")
+
+        self.width = width
+        self.strides = tuple(strides)
+        self.values = []
+
+        root_size = 1 << self.strides[0]
+        self.match = [-1] * root_size
+        self.child = [0] * root_size
+        self._lengths = [-1] * root_size
+        self._arrays = None
+
+    def __len__(self):
+        """Get the number of prefixes stored in the trie."""
+        return len(self.values)
+
+    def insert(self, key, length, value):
+        """
+        Store ``value`` for the prefix ``key/length``.
+
+        :param key: The prefix network address as an **int**.
+        :param length: The prefix length.
+        :param value: The object returned by `lookup` for matching keys.
+        """
+        if not 0 <= length <= self.width:
+            raise ValueError(f"prefix length must be between 0 and {self.width}")
+
+        index = len(self.values)
+        self.values.append(value)
+        self._arrays = None
+
+        node = 0
+        depth = 0
+
+        for level, stride in enumerate(self.strides):
+            shift = self.width - depth - stride
+            chunk = (key >> shift) & ((1 << stride) - 1)
+            slot = node + chunk
+
+            if length <= depth + stride:
+                # expand the prefix over every slot of this node it covers
+                span = 1 << (depth + stride - length)
+                first = node + (chunk & ~(span - 1))
+
+                for slot in range(first, first + span):
+                    if self._lengths[slot] <= length:
+                        self.match[slot] = index
+                        self._lengths[slot] = length
+
+                return
+
+            if not self.child[slot]:
+                size = 1 << self.strides[level + 1]
+
+                self.child[slot] = len(self.match)
+                self.match += [-1] * size
+                self.child += [0] * size
+                self._lengths += [-1] * size
+
+            node = self.child[slot]
+            depth += stride
+
+    def lookup(self, key):
+        """Return the value of the longest prefix matching ``key``, or None."""
+        node = 0
+        depth = 0
+        best = -1
+
+        for stride in self.strides:
+            shift = self.width - depth - stride
+            slot = node + ((key >> shift) & ((1 << stride) - 1))
+
+            if self.match[slot] >= 0:
+                best = self.match[slot]
+
+            node = self.child[slot]
+
+            if not node:
+                break
+
+            depth += stride
+
+        return self.values[best] if best >= 0 else None
+
+    def lookup_batch(self, keys):
+        """
+        Look up many keys at once.
+
+        Returns a numpy **int64** array with the index into ``values`` of the
+        longest matching prefix for each key, or ``-1`` where nothing matches.
+        The lookup loop is compiled with `numba <https://numba.pydata.org>`_ on
+        the first call when it is installed. Requires numpy and keys no wider
+        than 63 bits, so IPv6 tries are not supported.
+
+        :param keys: An array-like of **int** keys.
+        """
+        try:
+            import numpy as np
+        except ImportError:  # pragma: no cover
+            raise ImportError("lookup_batch() requires numpy") from None
+
+        if self.width > 63:
+            raise ValueError("lookup_batch() supports keys of up to 63 bits")
+
+        if self._arrays is None:
+            self._arrays = (
+                np.array(self.match, dtype=np.int64),
+                np.array(self.child, dtype=np.int64),
+                np.array(self.strides, dtype=np.int64),
+            )
+
+        keys = np.asarray(keys, dtype=np.int64)
+        out = np.empty(keys.shape[0], dtype=np.int64)
+
+        _lookup_batch_kernel()(*self._arrays, self.width, keys, out)
+
+        return out
@@ -21,8 +21,11 @@ extras = {
         "sphinx",
         "sphinx_rtd_theme",
     ],
+    "numba": ["numba", "numpy"],
+    "numpy": ["numpy"],
     "readthedocs": ["sphinx"],
-    "test": ["pytest >= 2.7.3"],
+    "speedups": ["orjson"],
+    "test": ["numpy", "pytest >= 2.7.3"],
 }
 extras["dev"] += extras["lint"] + extras["test"]
 
@@ -1,7 +1,10 @@
 """Test prsw.stat.routing_status"""
 
+import gc
 import ipaddress
+import numpy as np
 import pytest
+import weakref
 from datetime import datetime
 from typing import Iterable
 from unittest.mock import MagicMock, Mock, patch
@@ -9,8 +12,15 @@ from collections import namedtuple
 
 from .. import UnitTest
 
+from prsw import RIPEstat
 from prsw.api import API_URL, Output
-from prsw.stat.routing_status import RoutingStatus
+from prsw.stat.routing_status import (
+    RoutingStatus,
+    _ResponseCache,
+    _columns,
+    _network,
+    _responses,
+)
 
 
 class TestRoutingStatus(UnitTest):
@@ -73,6 +83,43 @@ class TestRoutingStatus(UnitTest):
         "time": "2021-05-15T16:56:50.312331"
     }
 
+    PREFIX_RESPONSE = {
+        **RESPONSE,
+        "data": {
+            "first_seen": {
+                "prefix": "193.0.0.0/21",
+                "origin": "3333",
+                "time": "2000-08-18T08:00:00"
+            },
+            "last_seen": {
+                "prefix": "193.0.0.0/21",
+                "origin": "3333",
+                "time": "2021-05-15T08:00:00"
+            },
+            "visibility": {
+                "v4": {
+                    "ris_peers_seeing": 328,
+                    "total_ris_peers": 328
+                },
+                "v6": {
+                    "ris_peers_seeing": 0,
+                    "total_ris_peers": 339
+                }
+            },
+            "more_specifics": [
+                {"prefix": "193.0.0.0/22", "origin": "3333"},
+                {"prefix": "193.0.4.0/23", "origin": "3333"},
+                {"prefix": "193.0.6.0/24", "origin": "12654"}
+            ],
+            "less_specifics": [
+                {"prefix": "193.0.0.0/16", "origin": "3320"},
+                {"prefix": "193.0.0.0/8", "origin": "1299"}
+            ],
+            "resource": "193.0.0.0/21",
+            "query_time": "2021-05-15T08:00:00"
+        },
+    }
+
     def setup(self):
         url = f"{API_URL}{RoutingStatus.PATH}data.json?resource=196"
 
@@ -81,9 +128,18 @@ class TestRoutingStatus(UnitTest):
             "preferred_version": RoutingStatus.VERSION,
             "resource": "196",
         }
+        RoutingStatus.clear_cache()
 
         return super().setup()
-    
+
+    def prefix_status(self):
+        """Return a RoutingStatus for a prefix, backed by PREFIX_RESPONSE."""
+        url = f"{API_URL}{RoutingStatus.PATH}data.json?resource=193.0.0.0/21"
+        output = Output(url, **TestRoutingStatus.PREFIX_RESPONSE)
+
+        with patch.object(self.ripestat, "_get", return_value=output):
+            return RoutingStatus(self.ripestat, "193.0.0.0/21", ttl=0)
+
     @pytest.fixture(scope="session")
     def mock_get(self):
         self.setup()
@@ -100,8 +156,32 @@ class TestRoutingStatus(UnitTest):
         response = RoutingStatus(mock_get.ripestat, self.params["resource"])
         assert isinstance(response, RoutingStatus)
 
+    def test__resource(self, mock_get):
+        response = RoutingStatus(mock_get.ripestat, 196)
+
+        assert response._resource(196) == 196
+        assert response._resource_type == "asn"
+        assert response._resource("196") == 196
+        assert response._resource_type == "asn"
+        assert response._resource("AS196") == 196
+        assert response._resource_type == "asn"
+        assert response._resource(" 196") == 196
+        assert response._resource("196 ") == 196
+        assert response._resource_type == "asn"
+        assert response._resource("193.0.0.0/21") == ipaddress.ip_network(
+            "193.0.0.0/21"
+        )
+        assert response._resource_type == "prefix"
+        assert response._resource("193.0.0.1") == ipaddress.ip_network("193.0.0.1/32")
+        assert response._resource(" 193.0.0.0/21 ") == ipaddress.ip_network(
+            "193.0.0.0/21"
+        )
+        assert response._resource("2001:db8::/32") == ipaddress.ip_network(
+            "2001:db8::/32"
+        )
+
     def test__init__invalid_asn_resources(self, mock_get):
-        test_resources = [-1, "abcdef"]
+        test_resources = [-1, "abcdef", True, 4294967296, "AS4294967296", "abc/24"]
 
         for resource in test_resources:
             with pytest.raises(ValueError):
@@ -137,6 +217,9 @@ class TestRoutingStatus(UnitTest):
         print(response.first_seen)
 
         assert isinstance(response.first_seen, tuple)
+        assert response.first_seen.time == datetime(2000, 8, 18, 8, 0)
+        assert response.first_seen.origin == 196
+        assert response.first_seen.prefix == ipaddress.ip_network("130.38.0.0/16")
 
     def test_last_seen(self, mock_get):
         mock_get.params = self.params # reset params
@@ -145,4 +228,377 @@ class TestRoutingStatus(UnitTest):
 
         print(response.last_seen)
 
-        assert isinstance(response.last_seen, tuple)
\ No newline at end of file
+        assert isinstance(response.last_seen, tuple)
+        assert response.last_seen.time == datetime(2021, 5, 15, 8, 0)
+        assert response.last_seen.prefix == ipaddress.ip_network("2001:1840:c000::/44")
+
+    def test__init__cached_response(self):
+        with patch.object(self.ripestat, "_get") as mocked_get:
+            mocked_get.return_value = self.api_response
+
+            first = RoutingStatus(self.ripestat, 196)
+            second = RoutingStatus(self.ripestat, "196")
+
+            mocked_get.assert_called_once_with(RoutingStatus.PATH, self.params)
+            assert first._api is second._api
+
+    def test__init__without_cache(self):
+        with patch.object(self.ripestat, "_get") as mocked_get:
+            mocked_get.return_value = self.api_response
+
+            RoutingStatus(self.ripestat, 196, ttl=0)
+            RoutingStatus(self.ripestat, 196, ttl=0)
+
+            assert mocked_get.call_count == 2
+            mocked_get.assert_called_with(RoutingStatus.PATH, self.params)
+
+    def test__init__cache_disabled(self, monkeypatch):
+        monkeypatch.setattr(RoutingStatus, "CACHE_TTL", 0)
+
+        with patch.object(self.ripestat, "_get") as mocked_get:
+            mocked_get.return_value = self.api_response
+
+            RoutingStatus(self.ripestat, 196)
+            RoutingStatus(self.ripestat, 196)
+
+            assert mocked_get.call_count == 2
+
+    def test__init__cache_disabled_with_etag(self, monkeypatch):
+        monkeypatch.setattr(RoutingStatus, "CACHE_TTL", 0)
+        url = f"{API_URL}{RoutingStatus.PATH}data.json?resource=196"
+        output = Output(url, etag='"5f2b8e4c"', **TestRoutingStatus.RESPONSE)
+
+        with patch.object(self.ripestat, "_get") as mocked_get:
+            mocked_get.return_value = output
+
+            RoutingStatus(self.ripestat, 196)
+            RoutingStatus(self.ripestat, 196)
+
+            mocked_get.assert_called_with(RoutingStatus.PATH, self.params)
+            assert len(_responses) == 0
+
+    def test__init__revalidates_expired(self):
+        url = f"{API_URL}{RoutingStatus.PATH}data.json?resource=196"
+        etag = '"5f2b8e4c"'
+        output = Output(url, etag=etag, **TestRoutingStatus.RESPONSE)
+
+        with patch.object(self.ripestat, "_get") as mocked_get:
+            mocked_get.return_value = output
+
+            with patch("prsw.stat.routing_status.time.time", return_value=0):
+                first = RoutingStatus(self.ripestat, 196)
+
+            mocked_get.return_value = None
+            second = RoutingStatus(self.ripestat, 196)
+
+            mocked_get.assert_called_with(
+                RoutingStatus.PATH, self.params, headers={"If-None-Match": etag}
+            )
+            assert second._api is first._api
+            assert len(_responses) == 1
+
+    def test__init__cache_shared_by_settings(self):
+        other = RIPEstat(sourceapp="other-test")
+
+        with patch.object(self.ripestat, "_get") as mocked_get, patch.object(
+            other, "_get"
+        ) as other_get:
+            mocked_get.return_value = self.api_response
+            other_get.return_value = self.api_response
+
+            RoutingStatus(self.ripestat, 196)
+            RoutingStatus(RIPEstat(sourceapp="dummy-test"), 196)
+            RoutingStatus(other, 196)
+
+            assert mocked_get.call_count == 1
+            assert other_get.call_count == 1
+
+    def test__init__cache_releases_client(self):
+        ripestat = RIPEstat(sourceapp="dummy-test")
+        reference = weakref.ref(ripestat)
+
+        with patch.object(ripestat, "_get", return_value=self.api_response):
+            RoutingStatus(ripestat, 196)
+
+        del ripestat
+        gc.collect()
+
+        assert reference() is None
+
+    def test__response_cache_evicts_least_recently_used(self):
+        cache = _ResponseCache(maxsize=2)
+
+        cache.set("a", "output a")
+        cache.set("b", "output b")
+        cache.get("a", RoutingStatus.CACHE_TTL)
+        cache.set("c", "output c")
+
+        assert len(cache) == 2
+        assert cache.get("a", RoutingStatus.CACHE_TTL) == "output a"
+        assert cache.get("b", RoutingStatus.CACHE_TTL) is None
+
+    def test__response_cache_expires_on_interval(self):
+        cache = _ResponseCache(maxsize=2)
+
+        with patch("prsw.stat.routing_status.time.time", return_value=3599):
+            cache.set("a", "output a")
+            assert cache.get("a", 3600) == "output a"
+
+        with patch("prsw.stat.routing_status.time.time", return_value=3600.5):
+            assert cache.get("a", 3600) is None
+
+    def test__response_cache_keeps_expired(self):
+        cache = _ResponseCache(maxsize=2)
+
+        with patch("prsw.stat.routing_status.time.time", return_value=0):
+            cache.set("a", "output a")
+
+        assert cache.get("a", RoutingStatus.CACHE_TTL) is None
+        assert cache.get_stale("a") == "output a"
+        assert cache.get_stale("b") is None
+
+    def test_clear_cache(self):
+        with patch.object(self.ripestat, "_get") as mocked_get:
+            mocked_get.return_value = self.api_response
+
+            RoutingStatus(self.ripestat, 196)
+            RoutingStatus.clear_cache()
+            RoutingStatus(self.ripestat, 196)
+
+            assert mocked_get.call_count == 2
+
+    def test_visibility(self, mock_get):
+        mock_get.params = self.params  # reset params
+
+        response = RoutingStatus(mock_get.ripestat, 196)
+
+        expected = self.RESPONSE["data"]["visibility"]
+
+        assert type(response.visibility).__name__ == "Visibility"
+        assert response.visibility.v4._asdict() == expected["v4"]
+        assert response.visibility.v6._asdict() == expected["v6"]
+
+    def test_more_specifics(self):
+        response = self.prefix_status()
+
+        expected = self.PREFIX_RESPONSE["data"]["more_specifics"]
+
+        assert len(response.more_specifics) == len(expected)
+
+        for more_specific, raw in zip(response.more_specifics, expected):
+            assert type(more_specific).__name__ == "MoreSpecific"
+            assert more_specific.prefix == ipaddress.ip_network(raw["prefix"])
+            assert more_specific.origin == int(raw["origin"])
+
+    def test_more_specifics_asn(self, mock_get):
+        mock_get.params = self.params  # reset params
+
+        response = RoutingStatus(mock_get.ripestat, 196)
+
+        assert response.more_specifics == []
+
+    def test_resource_type_per_instance(self, mock_get):
+        mock_get.params = self.params  # reset params
+
+        asn_status = RoutingStatus(mock_get.ripestat, 196)
+        prefix_status = self.prefix_status()
+
+        assert asn_status._resource_type == "asn"
+        assert prefix_status._resource_type == "prefix"
+        assert asn_status.more_specifics == []
+        assert len(prefix_status.more_specifics) == 3
+
+    def test_bulk(self):
+        with patch.object(self.ripestat, "_get") as mocked_get:
+            mocked_get.return_value = self.api_response
+
+            responses = RoutingStatus.bulk(self.ripestat, [196, 3333], ttl=0)
+
+            assert mocked_get.call_count == 2
+            assert all(isinstance(r, RoutingStatus) for r in responses)
+            assert [r._resource_type for r in responses] == ["asn", "asn"]
+
+        requested = [args[1]["resource"] for args, _ in mocked_get.call_args_list]
+        assert sorted(requested) == ["196", "3333"]
+
+    def test_properties_cached(self, mock_get):
+        mock_get.params = self.params  # reset params
+
+        response = RoutingStatus(mock_get.ripestat, 196)
+
+        assert response.query_time is response.query_time
+        assert response.announced_space is response.announced_space
+        assert response.visibility is response.visibility
+        assert response.first_seen is response.first_seen
+
+    def test_less_specifics(self):
+        response = self.prefix_status()
+
+        expected = self.PREFIX_RESPONSE["data"]["less_specifics"]
+
+        assert len(response.less_specifics) == len(expected)
+
+        for less_specific, raw in zip(response.less_specifics, expected):
+            assert type(less_specific).__name__ == "LessSpecific"
+            assert less_specific.prefix == ipaddress.ip_network(raw["prefix"])
+            assert less_specific.origin == int(raw["origin"])
+
+    def test_less_specifics_asn(self, mock_get):
+        mock_get.params = self.params  # reset params
+
+        response = RoutingStatus(mock_get.ripestat, 196)
+
+        assert response.less_specifics == []
+
+    def test__network(self):
+        assert _network("193.0.0.1/21") == ipaddress.IPv4Network("193.0.0.0/21")
+        assert _network("2001:1840:c000::1/44") == ipaddress.IPv6Network(
+            "2001:1840:c000::/44"
+        )
+
+        with pytest.raises(ValueError):
+            _network("invalid")
+
+    def test_slots(self, mock_get):
+        mock_get.params = self.params  # reset params
+
+        response = RoutingStatus(mock_get.ripestat, 196)
+        response.query_time
+
+        assert not hasattr(response, "__dict__")
+        assert response._cached_query_time is response.query_time
+
+    def test_more_specifics_v4(self):
+        response = self.prefix_status()
+
+        columns = response.more_specifics_v4
+
+        assert type(columns).__name__ == "PrefixColumns"
+        assert columns.net.dtype == "u4"
+        assert columns.net[0] == int(ipaddress.IPv4Address("193.0.0.0"))
+        assert list(columns.plen) == [22, 23, 24]
+        assert list(columns.origin) == [3333, 3333, 12654]
+        assert len(response.more_specifics_v6.net) == 0
+
+    def test_more_specifics_v4_asn(self, mock_get):
+        mock_get.params = self.params  # reset params
+
+        response = RoutingStatus(mock_get.ripestat, 196)
+
+        assert len(response.more_specifics_v4.net) == 0
+        assert len(response.more_specifics_v6.net) == 0
+
+    def test__columns(self):
+        rows = [
+            {"prefix": "2001:db8::/32", "origin": "3333"},
+            {"prefix": "193.0.0.1/22", "origin": "3333"},
+            {"prefix": "2001:db8:1::1/48", "origin": "12654"},
+        ]
+
+        v4, v6 = _columns(rows)
+
+        assert list(v4.net) == [int(ipaddress.IPv4Address("193.0.0.0"))]
+        assert list(v4.plen) == [22]
+        assert list(v4.origin) == [3333]
+
+        assert v6.net.shape == (2, 2)
+        assert v6.net[0][0] == 0x20010DB800000000
+        assert v6.net[1][0] == 0x20010DB800010000
+        assert v6.net[1][1] == 0
+        assert list(v6.plen) == [32, 48]
+        assert list(v6.origin) == [3333, 12654]
+
+    def test_more_specifics_array(self):
+        response = self.prefix_status()
+
+        rows = response.more_specifics_array()
+
+        assert len(rows) == 3
+        assert rows["net"][0] == int(ipaddress.IPv4Address("193.0.0.0"))
+        assert list(rows["plen"]) == [22, 23, 24]
+        assert list(rows["origin"]) == [3333, 3333, 12654]
+
+    def test_more_specifics_array_asn(self, mock_get):
+        mock_get.params = self.params  # reset params
+
+        response = RoutingStatus(mock_get.ripestat, 196)
+
+        assert len(response.more_specifics_array()) == 0
+
+    def test_lpm(self):
+        response = self.prefix_status()
+
+        assert response.lpm("193.0.6.1").prefix == ipaddress.ip_network("193.0.6.0/24")
+        assert response.lpm("193.0.6.1").origin == 12654
+        assert response.lpm("193.0.1.1").prefix == ipaddress.ip_network("193.0.0.0/22")
+        assert type(response.lpm("193.0.7.1")).__name__ == "LastSeen"
+        assert response.lpm("193.0.7.1").prefix == ipaddress.ip_network("193.0.0.0/21")
+        assert response.lpm("193.0.7.1").origin == 3333
+        assert type(response.lpm("193.0.8.1")).__name__ == "LessSpecific"
+        assert response.lpm("193.0.8.1").origin == 3320
+        assert response.lpm("193.1.0.1").origin == 1299
+        assert response.lpm("10.0.0.1") is None
+        assert response.lpm("2001:db8::1") is None
+
+    def test_specifics_parsed_lazily(self):
+        response = self.prefix_status()
+
+        assert isinstance(response._api.data["more_specifics"][0], dict)
+        assert isinstance(response._api.data["less_specifics"][0], dict)
+
+        with pytest.raises(AttributeError):
+            response._cached_more_specifics
+
+        response.more_specifics
+
+        assert isinstance(response._api.data["more_specifics"][0], dict)
+
+    def test_lpm_batch(self):
+        response = self.prefix_status()
+
+        ips = [
+            "193.0.6.1",
+            "193.0.1.1",
+            "193.0.7.1",
+            "193.0.8.1",
+            "193.1.0.1",
+            "10.0.0.1",
+        ]
+        keys = np.array([int(ipaddress.IPv4Address(ip)) for ip in ips], dtype="u4")
+
+        assert list(response.lpm_batch(keys)) == [12654, 3333, 3333, 3320, 1299, -1]
+
+    def test_lpm_batch_asn(self, mock_get):
+        mock_get.params = self.params  # reset params
+
+        response = RoutingStatus(mock_get.ripestat, 196)
+
+        assert list(response.lpm_batch(np.array([1, 2], dtype="u4"))) == [-1, -1]
+
+    def test_more_specifics_interns_origins(self):
+        response = self.prefix_status()
+
+        first, second, third = response.more_specifics
+
+        assert first.origin == second.origin == 3333
+        assert first.origin is second.origin
+        assert third.origin == 12654
+
+    def test__get_not_modified(self):
+        url = f"{API_URL}{RoutingStatus.PATH}data.json?resource=196"
+        etag = '"5f2b8e4c"'
+        output = Output(url, etag=etag, **TestRoutingStatus.RESPONSE)
+
+        with patch.object(self.ripestat, "_get") as mocked_get:
+            mocked_get.return_value = output
+            first = RoutingStatus(self.ripestat, 196)
+
+            mocked_get.assert_called_with(RoutingStatus.PATH, self.params)
+
+            mocked_get.return_value = None
+            second = RoutingStatus(self.ripestat, 196, ttl=0)
+
+            mocked_get.assert_called_with(
+                RoutingStatus.PATH, self.params, headers={"If-None-Match": etag}
+            )
+            assert second._api is first._api
@@ -1,9 +1,11 @@
+import json
 import pytest
+import requests
 from unittest import mock
 
 from . import UnitTest
 
-from prsw.api import get, Output, API_URL
+from prsw.api import get, session, Output, API_URL
 from prsw.exceptions import RequestError, ResponseError
 
 
@@ -23,14 +25,17 @@ class TestApi(UnitTest):
         "status_code": 200,
         "time": "2021-04-14T14:16:02.142290",
     }
+    ETAG = '"5f2b8e4c"'
 
     def mocked_get(*args, **kwargs):
-        """Mock requests.get()"""
+        """Mock prsw.api.session.get()"""
 
         class MockResponse:
-            def __init__(self, json_data, status_code):
+            def __init__(self, json_data, status_code, headers={}):
                 self.json_data = json_data
+                self.content = json.dumps(json_data).encode()
                 self.status_code = status_code
+                self.headers = headers
 
             def json(self):
                 return self.json_data
@@ -40,6 +45,10 @@ class TestApi(UnitTest):
 
         if "/success/" in args[0]:
             return MockResponse(TestApi.RESPONSE, 200)
+        if "/etag/" in args[0]:
+            if kwargs["headers"] == {"If-None-Match": TestApi.ETAG}:
+                return MockResponse({}, 304)
+            return MockResponse(TestApi.RESPONSE, 200, {"ETag": TestApi.ETAG})
         if "/notfound/" in args[0]:
             return MockResponse({}, 404)
         if "/error/" in args[0]:
@@ -61,29 +70,50 @@ class TestOutput(UnitTest):
 
 
 class TestGet(UnitTest):
-    @mock.patch("requests.get", side_effect=TestApi.mocked_get)
+    @mock.patch("prsw.api.session.get", side_effect=TestApi.mocked_get)
     def test_get__url(self, mock_get):
         response = get("/success", {"param": "test"})
         mock_get.assert_called()
         assert response._url == API_URL + "/success/data.json?param=test"
 
-    @mock.patch("requests.get", side_effect=TestApi.mocked_get)
+    @mock.patch("prsw.api.session.get", side_effect=TestApi.mocked_get)
     def test_get__successful_response(self, mock_get):
         error_message = f"response is not an instance of {Output}"
         response = get("/success")
         mock_get.assert_called()
         assert isinstance(response, Output), error_message
 
-    @mock.patch("requests.get", side_effect=TestApi.mocked_get)
+    @mock.patch("prsw.api.session.get", side_effect=TestApi.mocked_get)
+    def test_get__etag(self, mock_get):
+        response = get("/etag")
+        mock_get.assert_called_with(response._url, headers=None)
+        assert response.etag == TestApi.ETAG
+
+    @mock.patch("prsw.api.session.get", side_effect=TestApi.mocked_get)
+    def test_get__not_modified(self, mock_get):
+        headers = {"If-None-Match": TestApi.ETAG}
+        assert get("/etag", headers=headers) is None
+        mock_get.assert_called_with(API_URL + "/etag/data.json?", headers=headers)
+
+    @mock.patch("prsw.api.session.get", side_effect=TestApi.mocked_get)
     def test_get__error_response(self, mock_get):
         with pytest.raises(RequestError):
             get("/error")
 
         mock_get.assert_called()
 
-    @mock.patch("requests.get", side_effect=TestApi.mocked_get)
+    @mock.patch("prsw.api.session.get", side_effect=TestApi.mocked_get)
     def test_get__not_found_response(self, mock_get):
         with pytest.raises(RequestError):
             get("/notfound")
 
         mock_get.assert_called()
+
+
+class TestSession(UnitTest):
+    def test_session__reused(self):
+        assert isinstance(session, requests.Session)
+
+    def test_session__connection_pool(self):
+        adapter = session.get_adapter(API_URL)
+        assert adapter._pool_maxsize == 32
@@ -15,7 +15,7 @@ from prsw.stat.whats_my_ip import WhatsMyIp
 
 
 class TestRIPEstat(UnitTest):
-    def mocked_get(*args):
+    def mocked_get(*args, **kwargs):
         """Mock prsw.api.get()"""
 
         class MockOutputResponse:
@@ -60,6 +60,14 @@ class TestRIPEstat(UnitTest):
 
         mock_get.assert_called_with("/test", {"data_overload_limit": "ignore"})
 
+    @mock.patch("prsw.ripe_stat.get", side_effect=mocked_get)
+    def test__get_with_headers(self, mock_get):
+        ripestat = RIPEstat()
+        headers = {"If-None-Match": '"5f2b8e4c"'}
+        ripestat._get("/test", headers=headers)
+
+        mock_get.assert_called_with("/test", {}, headers=headers)
+
     def test_abuse_contact_finder(self):
         assert self.ripestat.abuse_contact_finder.func == AbuseContactFinder
 
@@ -0,0 +1,116 @@
+import numpy as np
+import pytest
+import subprocess
+import sys
+from ipaddress import ip_address, ip_network
+
+from . import UnitTest
+
+from prsw.trie import MultibitTrie
+
+
+class TestMultibitTrie(UnitTest):
+    PREFIXES = [
+        "0.0.0.0/0",
+        "193.0.0.0/8",
+        "193.0.0.0/16",
+        "193.0.0.0/21",
+        "193.0.6.0/24",
+        "193.0.6.128/25",
+        "193.0.6.129/32",
+    ]
+
+    def setup(self):
+        self.trie = MultibitTrie(32, (16, 4, 4, 4, 4))
+
+        for prefix in TestMultibitTrie.PREFIXES:
+            network = ip_network(prefix)
+            self.trie.insert(int(network.network_address), network.prefixlen, prefix)
+
+        return super().setup()
+
+    def test__init__invalid_strides(self):
+        with pytest.raises(ValueError):
+            MultibitTrie(32, (16, 8))
+
+    def test__len__(self):
+        assert len(self.trie) == len(TestMultibitTrie.PREFIXES)
+
+    def test_insert__invalid_length(self):
+        with pytest.raises(ValueError):
+            self.trie.insert(0, 33, "invalid")
+
+    def test_lookup(self):
+        expected = {
+            "10.0.0.1": "0.0.0.0/0",
+            "193.1.0.1": "193.0.0.0/8",
+            "193.0.8.1": "193.0.0.0/16",
+            "193.0.1.1": "193.0.0.0/21",
+            "193.0.6.1": "193.0.6.0/24",
+            "193.0.6.130": "193.0.6.128/25",
+            "193.0.6.129": "193.0.6.129/32",
+        }
+
+        for ip, prefix in expected.items():
+            assert self.trie.lookup(int(ip_address(ip))) == prefix
+
+    def test_lookup__insert_order(self):
+        trie = MultibitTrie(32, (16, 4, 4, 4, 4))
+
+        for prefix in reversed(TestMultibitTrie.PREFIXES):
+            network = ip_network(prefix)
+            trie.insert(int(network.network_address), network.prefixlen, prefix)
+
+        assert trie.lookup(int(ip_address("193.0.1.1"))) == "193.0.0.0/21"
+        assert trie.lookup(int(ip_address("193.0.6.1"))) == "193.0.6.0/24"
+
+    def test_lookup__no_match(self):
+        trie = MultibitTrie(128, (16,) + (4,) * 28)
+        network = ip_network("2001:db8::/32")
+        trie.insert(int(network.network_address), network.prefixlen, "2001:db8::/32")
+
+        assert trie.lookup(int(ip_address("2001:db8::1"))) == "2001:db8::/32"
+        assert trie.lookup(int(ip_address("2001:db9::1"))) is None
+
+    def test_lookup_batch(self):
+        keys = [int(ip_address(ip)) for ip in ["193.0.6.1", "193.0.1.1", "10.0.0.1"]]
+
+        matches = self.trie.lookup_batch(np.array(keys, dtype="u4"))
+
+        assert [self.trie.values[index] for index in matches] == [
+            "193.0.6.0/24",
+            "193.0.0.0/21",
+            "0.0.0.0/0",
+        ]
+
+    def test_lookup_batch__no_match(self):
+        trie = MultibitTrie(32, (16, 4, 4, 4, 4))
+        network = ip_network("193.0.0.0/21")
+        trie.insert(int(network.network_address), network.prefixlen, "193.0.0.0/21")
+
+        keys = np.array([int(ip_address("10.0.0.1"))], dtype="u4")
+
+        assert list(trie.lookup_batch(keys)) == [-1]
+
+    def test_lookup_batch__rebuilt_after_insert(self):
+        key = int(ip_address("193.0.6.129"))
+
+        self.trie.lookup_batch([key])
+        self.trie.insert(key, 32, "new")
+
+        assert self.trie.values[self.trie.lookup_batch([key])[0]] == "new"
+
+    def test_lookup_batch__ipv6(self):
+        trie = MultibitTrie(128, (16,) + (4,) * 28)
+
+        with pytest.raises(ValueError):
+            trie.lookup_batch([1])
+
+    def test_import__optional_dependencies_deferred(self):
+        code = (
+            "import sys, prsw; "
+            "assert 'numba' not in sys.modules; "
+            "assert 'numpy' not in sys.modules"
+        )
+
+        subprocess.run([sys.executable, "-c", code], check=True)